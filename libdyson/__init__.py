@@ -1,6 +1,8 @@
 """Dyson Python library."""
 
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, List, Optional
+
 from .const import (
     DEVICE_TYPE_360_EYE,
     DEVICE_TYPE_360_HEURIST,
@@ -35,58 +37,135 @@ from .const import VacuumVisNavPowerMode  # noqa: F401
 from .const import VacuumState  # noqa: F401
 from .const import WaterHardness  # noqa: F401
 from .discovery import DysonDiscovery  # noqa: F401
-from .dyson_360_eye import Dyson360Eye
-from .dyson_360_heurist import Dyson360Heurist
-from .dyson_360_vis_nav import Dyson360VisNav
 from .dyson_device import DysonDevice
-from .dyson_pure_cool import DysonPureCool
-from .dyson_pure_cool_link import DysonPureCoolLink
-from .dyson_pure_hot_cool import DysonPureHotCool
-from .dyson_pure_hot_cool_link import DysonPureHotCoolLink
-from .dyson_pure_humidify_cool import DysonPurifierHumidifyCool
-from .dyson_purifier_big_quiet import DysonBigQuiet
 from .utils import get_mqtt_info_from_wifi_info  # noqa: F401
 
+if TYPE_CHECKING:
+    from .dyson_360_eye import Dyson360Eye  # noqa: F401
+    from .dyson_360_heurist import Dyson360Heurist  # noqa: F401
+    from .dyson_360_vis_nav import Dyson360VisNav  # noqa: F401
+    from .dyson_pure_cool import DysonPureCool  # noqa: F401
+    from .dyson_pure_cool_link import DysonPureCoolLink  # noqa: F401
+    from .dyson_pure_hot_cool import DysonPureHotCool  # noqa: F401
+    from .dyson_pure_hot_cool_link import DysonPureHotCoolLink  # noqa: F401
+    from .dyson_pure_humidify_cool import DysonPurifierHumidifyCool  # noqa: F401
+    from .dyson_purifier_big_quiet import DysonBigQuiet  # noqa: F401
+
+__all__ = [
+    "CleaningMode",
+    "CleaningType",
+    "DEVICE_TYPE_360_EYE",
+    "DEVICE_TYPE_360_HEURIST",
+    "DEVICE_TYPE_360_VIS_NAV",
+    "DEVICE_TYPE_NAMES",
+    "DEVICE_TYPE_PURE_COOL",
+    "DEVICE_TYPE_PURE_COOL_DESK",
+    "DEVICE_TYPE_PURE_COOL_LINK",
+    "DEVICE_TYPE_PURE_COOL_LINK_DESK",
+    "DEVICE_TYPE_PURE_HOT_COOL",
+    "DEVICE_TYPE_PURE_HOT_COOL_LINK",
+    "DEVICE_TYPE_PURE_HUMIDIFY_COOL",
+    "DEVICE_TYPE_PURIFIER_BIG_QUIET",
+    "DEVICE_TYPE_PURIFIER_COOL_E",
+    "DEVICE_TYPE_PURIFIER_COOL_K",
+    "DEVICE_TYPE_PURIFIER_COOL_M",
+    "DEVICE_TYPE_PURIFIER_HOT_COOL_E",
+    "DEVICE_TYPE_PURIFIER_HOT_COOL_K",
+    "DEVICE_TYPE_PURIFIER_HOT_COOL_M",
+    "DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E",
+    "DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K",
+    "Dyson360Eye",
+    "Dyson360Heurist",
+    "Dyson360VisNav",
+    "DysonBigQuiet",
+    "DysonDevice",
+    "DysonDiscovery",
+    "DysonPureCool",
+    "DysonPureCoolLink",
+    "DysonPureHotCool",
+    "DysonPureHotCoolLink",
+    "DysonPurifierHumidifyCool",
+    "HumidifyOscillationMode",
+    "MessageType",
+    "Tilt",
+    "VacuumEyePowerMode",
+    "VacuumHeuristPowerMode",
+    "VacuumState",
+    "VacuumVisNavPowerMode",
+    "WaterHardness",
+    "get_device",
+    "get_mqtt_info_from_wifi_info",
+]
+
+# Concrete device classes are only imported once they are first used,
+# either through get_device or as attributes of this package.
+_DEVICE_CLASS_MODULES = {
+    "Dyson360Eye": ".dyson_360_eye",
+    "Dyson360Heurist": ".dyson_360_heurist",
+    "Dyson360VisNav": ".dyson_360_vis_nav",
+    "DysonPureCool": ".dyson_pure_cool",
+    "DysonPureCoolLink": ".dyson_pure_cool_link",
+    "DysonPureHotCool": ".dyson_pure_hot_cool",
+    "DysonPureHotCoolLink": ".dyson_pure_hot_cool_link",
+    "DysonPurifierHumidifyCool": ".dyson_pure_humidify_cool",
+    "DysonBigQuiet": ".dyson_purifier_big_quiet",
+}
+
+_DEVICE_CLASSES = {
+    DEVICE_TYPE_360_EYE: "Dyson360Eye",
+    DEVICE_TYPE_360_HEURIST: "Dyson360Heurist",
+    DEVICE_TYPE_360_VIS_NAV: "Dyson360VisNav",
+    DEVICE_TYPE_PURE_COOL_LINK_DESK: "DysonPureCoolLink",
+    DEVICE_TYPE_PURE_COOL_LINK: "DysonPureCoolLink",
+    DEVICE_TYPE_PURE_COOL: "DysonPureCool",
+    DEVICE_TYPE_PURIFIER_COOL_K: "DysonPureCool",
+    DEVICE_TYPE_PURIFIER_COOL_E: "DysonPureCool",
+    DEVICE_TYPE_PURIFIER_COOL_M: "DysonPureCool",
+    DEVICE_TYPE_PURE_COOL_DESK: "DysonPureCool",
+    DEVICE_TYPE_PURE_HOT_COOL_LINK: "DysonPureHotCoolLink",
+    DEVICE_TYPE_PURE_HOT_COOL: "DysonPureHotCool",
+    DEVICE_TYPE_PURIFIER_HOT_COOL_E: "DysonPureHotCool",
+    DEVICE_TYPE_PURIFIER_HOT_COOL_K: "DysonPureHotCool",
+    DEVICE_TYPE_PURIFIER_HOT_COOL_M: "DysonPureHotCool",
+    DEVICE_TYPE_PURE_HUMIDIFY_COOL: "DysonPurifierHumidifyCool",
+    DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K: "DysonPurifierHumidifyCool",
+    DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E: "DysonPurifierHumidifyCool",
+    DEVICE_TYPE_PURIFIER_BIG_QUIET: "DysonBigQuiet",
+}
+
+# Vacuum robots have a fixed device type and do not take it as an argument.
+_VACUUM_DEVICE_TYPES = frozenset(
+    {
+        DEVICE_TYPE_360_EYE,
+        DEVICE_TYPE_360_HEURIST,
+        DEVICE_TYPE_360_VIS_NAV,
+    }
+)
+
+
+def __getattr__(name: str):
+    """Import device classes on first access."""
+    module_name = _DEVICE_CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    device_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = device_class
+    return device_class
+
+
+def __dir__() -> List[str]:
+    """List package attributes including the lazily imported device classes."""
+    return sorted(set(globals()) | set(_DEVICE_CLASS_MODULES))
+
 
 def get_device(serial: str, credential: str, device_type: str) -> Optional[DysonDevice]:
     """Get a new DysonDevice instance."""
-    if device_type == DEVICE_TYPE_360_EYE:
-        return Dyson360Eye(serial, credential)
-    if device_type == DEVICE_TYPE_360_HEURIST:
-        return Dyson360Heurist(serial, credential)
-    if device_type == DEVICE_TYPE_360_VIS_NAV:
-        return Dyson360VisNav(serial, credential)
-    if device_type in [
-        DEVICE_TYPE_PURE_COOL_LINK_DESK,
-        DEVICE_TYPE_PURE_COOL_LINK,
-    ]:
-        return DysonPureCoolLink(serial, credential, device_type)
-    if device_type in [
-        DEVICE_TYPE_PURE_COOL,
-        DEVICE_TYPE_PURIFIER_COOL_K,
-        DEVICE_TYPE_PURIFIER_COOL_E,
-        DEVICE_TYPE_PURIFIER_COOL_M,
-        DEVICE_TYPE_PURE_COOL_DESK,
-    ]:
-        return DysonPureCool(serial, credential, device_type)
-    if device_type == DEVICE_TYPE_PURE_HOT_COOL_LINK:
-        return DysonPureHotCoolLink(serial, credential, device_type)
-    if device_type in [
-        DEVICE_TYPE_PURE_HOT_COOL,
-        DEVICE_TYPE_PURIFIER_HOT_COOL_E,
-        DEVICE_TYPE_PURIFIER_HOT_COOL_K,
-        DEVICE_TYPE_PURIFIER_HOT_COOL_M,
-    ]:
-        return DysonPureHotCool(serial, credential, device_type)
-    if device_type in [
-        DEVICE_TYPE_PURE_HUMIDIFY_COOL,
-        DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K,
-        DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E,
-    ]:
-        return DysonPurifierHumidifyCool(serial, credential, device_type)
-    if device_type in {
-        DEVICE_TYPE_PURIFIER_BIG_QUIET,
-    }:
-        return DysonBigQuiet(serial, credential, device_type)
-    return None
-
+    class_name = _DEVICE_CLASSES.get(device_type)
+    if class_name is None:
+        return None
+    device_class = globals().get(class_name)
+    if device_class is None:
+        device_class = __getattr__(class_name)
+    if device_type in _VACUUM_DEVICE_TYPES:
+        return device_class(serial, credential)
+    return device_class(serial, credential, device_type)
@@ -7,7 +7,7 @@ import attr
 from .utils import decrypt_password
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class DysonDeviceInfo:
     """Dyson device info."""
 
@@ -24,7 +24,7 @@ class DysonDeviceInfo:
     def from_raw(cls, raw: dict):
         """Parse raw data."""
         return cls(
-            raw["Active"] if "Active" in raw else None,
+            raw.get("Active"),
             raw["Serial"],
             raw["Name"],
             raw["Version"],
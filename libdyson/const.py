@@ -1,5 +1,6 @@
 """Constants for Dyson Python library."""
 from enum import Enum, auto
+from types import MappingProxyType
 
 DEVICE_TYPE_360_EYE = "N223"
 DEVICE_TYPE_360_HEURIST = "276"
@@ -21,27 +22,29 @@ DEVICE_TYPE_PURIFIER_HOT_COOL_K = "527K"  # HP07 AND HP09
 DEVICE_TYPE_PURIFIER_HOT_COOL_M = "527M"  # HP11 AND HP1
 DEVICE_TYPE_PURIFIER_BIG_QUIET = "664"  # BP02, BP03, and BP04
 
-DEVICE_TYPE_NAMES = {
-    DEVICE_TYPE_360_EYE: "360 Eye robot vacuum",
-    DEVICE_TYPE_360_HEURIST: "360 Heurist robot vacuum",
-    DEVICE_TYPE_360_VIS_NAV: "360 Vis Nav robot vacuum",
-    DEVICE_TYPE_PURE_COOL: "Pure Cool",
-    DEVICE_TYPE_PURIFIER_COOL_K: "Purifier Cool K Series (TP07/TP09)",
-    DEVICE_TYPE_PURIFIER_COOL_E: "Purifier Cool E Series (TP07/TP09)",
-    DEVICE_TYPE_PURIFIER_COOL_M: "Purifier Cool M Series (TP11/PC1)",
-    DEVICE_TYPE_PURE_COOL_DESK: "Pure Cool Link Desk",
-    DEVICE_TYPE_PURE_COOL_LINK: "Pure Cool Link",
-    DEVICE_TYPE_PURE_COOL_LINK_DESK: "Pure Cool Link Desk",
-    DEVICE_TYPE_PURE_HOT_COOL: "Pure Hot+Cool",
-    DEVICE_TYPE_PURIFIER_HOT_COOL_E: "Pure Hot+Cool (New)",
-    DEVICE_TYPE_PURE_HOT_COOL_LINK: "Pure Hot+Cool Link",
-    DEVICE_TYPE_PURE_HUMIDIFY_COOL: "Pure Humidify+Cool",
-    DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K: "Purifier Humidify+Cool",
-    DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E: "Purifier Humidify+Cool",
-    DEVICE_TYPE_PURIFIER_HOT_COOL_K: "Purifier Hot+Cool K Series (HP07/HP09)",
-    DEVICE_TYPE_PURIFIER_HOT_COOL_M: "Purifier Hot+Cool M Series (HP11/HP1)",
-    DEVICE_TYPE_PURIFIER_BIG_QUIET: "Purifier Big+Quiet Series"
-}
+DEVICE_TYPE_NAMES = MappingProxyType(
+    {
+        DEVICE_TYPE_360_EYE: "360 Eye robot vacuum",
+        DEVICE_TYPE_360_HEURIST: "360 Heurist robot vacuum",
+        DEVICE_TYPE_360_VIS_NAV: "360 Vis Nav robot vacuum",
+        DEVICE_TYPE_PURE_COOL: "Pure Cool",
+        DEVICE_TYPE_PURIFIER_COOL_K: "Purifier Cool K Series (TP07/TP09)",
+        DEVICE_TYPE_PURIFIER_COOL_E: "Purifier Cool E Series (TP07/TP09)",
+        DEVICE_TYPE_PURIFIER_COOL_M: "Purifier Cool M Series (TP11/PC1)",
+        DEVICE_TYPE_PURE_COOL_DESK: "Pure Cool Link Desk",
+        DEVICE_TYPE_PURE_COOL_LINK: "Pure Cool Link",
+        DEVICE_TYPE_PURE_COOL_LINK_DESK: "Pure Cool Link Desk",
+        DEVICE_TYPE_PURE_HOT_COOL: "Pure Hot+Cool",
+        DEVICE_TYPE_PURIFIER_HOT_COOL_E: "Pure Hot+Cool (New)",
+        DEVICE_TYPE_PURE_HOT_COOL_LINK: "Pure Hot+Cool Link",
+        DEVICE_TYPE_PURE_HUMIDIFY_COOL: "Pure Humidify+Cool",
+        DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K: "Purifier Humidify+Cool",
+        DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E: "Purifier Humidify+Cool",
+        DEVICE_TYPE_PURIFIER_HOT_COOL_K: "Purifier Hot+Cool K Series (HP07/HP09)",
+        DEVICE_TYPE_PURIFIER_HOT_COOL_M: "Purifier Hot+Cool M Series (HP11/HP1)",
+        DEVICE_TYPE_PURIFIER_BIG_QUIET: "Purifier Big+Quiet Series",
+    }
+)
 
 ENVIRONMENTAL_OFF = -1
 ENVIRONMENTAL_INIT = -2
@@ -19,12 +19,32 @@ from .exceptions import (
     DysonInvalidCredential,
     DysonNotConnected, DysonNoEnvironmentalData,
 )
-from .utils import mqtt_time
+from .utils import PADDED_VALUES, mqtt_time
 
 _LOGGER = logging.getLogger(__name__)
 
 TIMEOUT = 10
 
+_STATUS_MESSAGE_TYPES = frozenset({"CURRENT-STATE", "STATE-CHANGE"})
+
+# Non-numeric values sensors report instead of a reading.
+_ENVIRONMENTAL_STATES = {
+    "OFF": ENVIRONMENTAL_OFF,
+    "off": ENVIRONMENTAL_OFF,
+    "INIT": ENVIRONMENTAL_INIT,
+    "FAIL": ENVIRONMENTAL_FAIL,
+    "NONE": None,
+}
+# None is a mapped state, so lookups need a distinct default.
+_NOT_A_STATE = object()
+
+# Only the time and data of a STATE-SET message change between commands.
+_STATE_SET_PAYLOAD = (
+    '{"msg": "STATE-SET", "time": "%s", "mode-reason": "LAPP", "data": %s}'
+)
+# Status requests carry nothing but the message type and time.
+_REQUEST_PAYLOAD = '{"msg": "%s", "time": "%s"}'
+
 
 class DysonDevice:
     """Base class for dyson devices."""
@@ -89,7 +109,7 @@ class DysonDevice:
             self._connected.set()
 
         def _on_disconnect(client, userdata, rc):
-            _LOGGER.debug(f"Disconnected with result code {str(rc)}")
+            _LOGGER.debug("Disconnected with result code %s", rc)
 
         self._disconnected.set()
 
@@ -141,7 +161,7 @@ class DysonDevice:
             callback(MessageType.STATE)
 
     def _on_disconnect(self, client, userdata, rc):
-        _LOGGER.debug(f"Disconnected with result code {str(rc)}")
+        _LOGGER.debug("Disconnected with result code %s", rc)
         self._connected.clear()
         self._disconnected.set()
         for callback in self._callbacks:
@@ -152,7 +172,7 @@ class DysonDevice:
         self._handle_message(payload)
 
     def _handle_message(self, payload: dict) -> None:
-        if payload["msg"] in ["CURRENT-STATE", "STATE-CHANGE"]:
+        if payload["msg"] in _STATUS_MESSAGE_TYPES:
             _LOGGER.debug("New state: %s", payload)
             self._update_status(payload)
             if not self._status_data_available.is_set():
@@ -180,20 +200,27 @@ class DysonDevice:
         """Request current status."""
         if not self.is_connected:
             raise DysonNotConnected
-        payload = {
-            "msg": "REQUEST-CURRENT-STATE",
-            "time": mqtt_time(),
-        }
-        self._mqtt_client.publish(self._command_topic, json.dumps(payload))
+        payload = _REQUEST_PAYLOAD % ("REQUEST-CURRENT-STATE", mqtt_time())
+        self._mqtt_client.publish(self._command_topic, payload)
 
 
 class DysonFanDevice(DysonDevice):
     """Dyson fan device."""
 
+    # Plain class attributes shadow the topic properties of DysonDevice so
+    # that __init__ can store the prebuilt topics on the instance.
+    _command_topic = None
+    _status_topic = None
+
     def __init__(self, serial: str, credential: str, device_type: str):
         """Initialize the device."""
         super().__init__(serial, credential)
         self._device_type = device_type
+        self._status = {}
+        # Topics never change for a fan, so they are built once rather than
+        # formatted again for every published command.
+        self._command_topic = f"{device_type}/{serial}/command"
+        self._status_topic = f"{device_type}/{serial}/status/current"
 
         self._environmental_data = {}
         self._environmental_data_available = threading.Event()
@@ -203,20 +230,15 @@ class DysonFanDevice(DysonDevice):
         """Device type."""
         return self._device_type
 
-    @property
-    def _status_topic(self) -> str:
-        """MQTT status topic."""
-        return f"{self.device_type}/{self._serial}/status/current"
-
     @property
     def fan_state(self) -> bool:
         """Return if the fan is running."""
-        return self._get_field_value(self._status, "fnst") == "FAN"
+        return self._status.get("fnst") == "FAN"
 
     @property
     def speed(self) -> Optional[int]:
         """Return fan speed."""
-        speed = self._get_field_value(self._status, "fnsp")
+        speed = self._status.get("fnsp")
         if speed == "AUTO":
             return None
         return int(speed)
@@ -239,22 +261,22 @@ class DysonFanDevice(DysonDevice):
     @property
     def night_mode(self) -> bool:
         """Return night mode status."""
-        return self._get_field_value(self._status, "nmod") == "ON"
+        return self._status.get("nmod") == "ON"
 
     @property
     def continuous_monitoring(self) -> bool:
         """Return standby monitoring status."""
-        return self._get_field_value(self._status, "rhtm") == "ON"
+        return self._status.get("rhtm") == "ON"
 
     @property
     def error_code(self) -> str:
         """Return error code."""
-        return self._get_field_value(self._status, "ercd")
+        return self._status.get("ercd")
 
     @property
     def warning_code(self) -> str:
         """Return warning code."""
-        return self._get_field_value(self._status, "wacd")
+        return self._status.get("wacd")
 
     @property
     def formaldehyde(self) -> Optional[float]:
@@ -287,21 +309,16 @@ class DysonFanDevice(DysonDevice):
 
     @staticmethod
     def _get_field_value(state: Dict[str, Any], field: str):
-        try:
-            return  state[field][1] if isinstance(state[field], list) else state[field]
-        except:
-            return None
+        value = state.get(field)
+        return value[1] if isinstance(value, list) else value
 
     def _get_environmental_field_value(self, field, divisor=1) -> Optional[Union[int, float]]:
         value = self._get_field_value(self._environmental_data, field)
-        if value == "OFF" or value == "off":
-            return ENVIRONMENTAL_OFF
-        if value == "INIT":
-            return ENVIRONMENTAL_INIT
-        if value == "FAIL":
-            return ENVIRONMENTAL_FAIL
-        if value == "NONE" or value is None:
+        if value is None:
             return None
+        state = _ENVIRONMENTAL_STATES.get(value, _NOT_A_STATE)
+        if state is not _NOT_A_STATE:
+            return state
         if divisor == 1:
             return int(value)
         return float(value) / divisor
@@ -317,19 +334,17 @@ class DysonFanDevice(DysonDevice):
                 callback(MessageType.ENVIRONMENTAL)
 
     def _update_status(self, payload: dict) -> None:
-        self._status = payload["product-state"]
+        # State changes report fields as [previous, current] pairs. Only keep
+        # the current value so that properties need a single lookup.
+        self._status = {
+            field: value[1] if isinstance(value, list) else value
+            for field, value in payload["product-state"].items()
+        }
 
     def _set_configuration(self, **kwargs: dict) -> None:
         if not self.is_connected:
             raise DysonNotConnected
-        payload = json.dumps(
-            {
-                "msg": "STATE-SET",
-                "time": mqtt_time(),
-                "mode-reason": "LAPP",
-                "data": kwargs,
-            }
-        )
+        payload = _STATE_SET_PAYLOAD % (mqtt_time(), json.dumps(kwargs))
         self._mqtt_client.publish(self._command_topic, payload, 1)
 
     def _request_first_data(self) -> bool:
@@ -346,11 +361,11 @@ class DysonFanDevice(DysonDevice):
         """Request environmental sensor data."""
         if not self.is_connected:
             raise DysonNotConnected
-        payload = {
-            "msg": "REQUEST-PRODUCT-ENVIRONMENT-CURRENT-SENSOR-DATA",
-            "time": mqtt_time(),
-        }
-        self._mqtt_client.publish(self._command_topic, json.dumps(payload))
+        payload = _REQUEST_PAYLOAD % (
+            "REQUEST-PRODUCT-ENVIRONMENT-CURRENT-SENSOR-DATA",
+            mqtt_time(),
+        )
+        self._mqtt_client.publish(self._command_topic, payload)
 
     @abstractmethod
     def turn_on(self) -> None:
@@ -406,7 +421,7 @@ class DysonFanDevice(DysonDevice):
         """Set sleep timer."""
         if not 0 < duration <= 540:
             raise ValueError("Duration must be between 1 and 540")
-        self._set_configuration(sltm="%04d" % duration)
+        self._set_configuration(sltm=PADDED_VALUES[duration])
 
     def disable_sleep_timer(self) -> None:
         """Disable sleep timer."""
@@ -423,22 +438,22 @@ class DysonHeatingDevice(DysonFanDevice):
     @property
     def focus_mode(self) -> bool:
         """Return if fan focus mode is on."""
-        return self._get_field_value(self._status, "ffoc") == "ON"
+        return self._status.get("ffoc") == "ON"
 
     @property
     def heat_target(self) -> float:
         """Return heat target in kelvin."""
-        return int(self._get_field_value(self._status, "hmax")) / 10
+        return int(self._status.get("hmax")) / 10
 
     @property
     def heat_mode_is_on(self) -> bool:
         """Return if heat mode is set to on."""
-        return self._get_field_value(self._status, "hmod") == "HEAT"
+        return self._status.get("hmod") == "HEAT"
 
     @property
     def heat_status_is_on(self) -> bool:
         """Return if the device is currently heating."""
-        return self._get_field_value(self._status, "hsta") == "HEAT"
+        return self._status.get("hsta") == "HEAT"
 
     def set_heat_target(self, heat_target: float) -> None:
         """Set heat target in kelvin."""
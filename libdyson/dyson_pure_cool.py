@@ -1,9 +1,24 @@
 """Dyson Pure Cool fan."""
 
-from abc import abstractmethod
 from typing import Optional
 
 from .dyson_device import DysonFanDevice
+from .utils import PADDED_VALUES
+
+_OSCILLATION_ON_VALUES = frozenset({"OION", "ON"})
+_OSCILLATION_OION_VALUES = frozenset({"OION", "OIOF"})
+
+
+def _validate_oscillation_angles(angle_low: int, angle_high: int) -> None:
+    """Raise ValueError if the oscillation angles are not valid."""
+    if not 5 <= angle_low <= 355:
+        raise ValueError("angle_low must be between 5 and 355")
+    if not 5 <= angle_high <= 355:
+        raise ValueError("angle_high must be between 5 and 355")
+    if angle_low != angle_high and angle_low + 30 > angle_high:
+        raise ValueError(
+            "angle_high must be either equal to angle_low or at least 30 larger than angle_low"
+        )
 
 
 class DysonPureCoolBase(DysonFanDevice):
@@ -12,37 +27,39 @@ class DysonPureCoolBase(DysonFanDevice):
     @property
     def is_on(self) -> bool:
         """Return if the device is on."""
-        return self._get_field_value(self._status, "fpwr") == "ON"
+        return self._status.get("fpwr") == "ON"
 
     @property
     def auto_mode(self) -> bool:
         """Return auto mode status."""
-        return self._get_field_value(self._status, "auto") == "ON"
+        return self._status.get("auto") == "ON"
 
     @property
-    @abstractmethod
     def oscillation(self) -> bool:
         """Return oscillation status."""
+        # Seems some devices use OION/OIOF while others uses ON/OFF
+        # https://github.com/shenxn/ha-dyson/issues/22
+        return self._status.get("oson") in _OSCILLATION_ON_VALUES
 
     @property
     def oscillation_status(self) -> bool:
         """Return the status of oscillation."""
-        return self._get_field_value(self._status, "oscs") == "ON"
+        return self._status.get("oscs") == "ON"
 
     @property
     def front_airflow(self) -> bool:
         """Return if airflow from front is on."""
-        return self._get_field_value(self._status, "fdir") == "ON"
+        return self._status.get("fdir") == "ON"
 
     @property
     def night_mode_speed(self) -> int:
         """Return speed in night mode."""
-        return int(self._get_field_value(self._status, "nmdv"))
+        return int(self._status.get("nmdv"))
 
     @property
     def carbon_filter_life(self) -> Optional[int]:
         """Return carbon filter life in percentage."""
-        filter_life = self._get_field_value(self._status, "cflr")
+        filter_life = self._status.get("cflr")
         if filter_life == "INV":
             return None
         return int(filter_life)
@@ -50,7 +67,7 @@ class DysonPureCoolBase(DysonFanDevice):
     @property
     def hepa_filter_life(self) -> Optional[int]:
         """Return HEPA filter life in percentage."""
-        return int(self._get_field_value(self._status, "hflr"))
+        return int(self._status.get("hflr"))
 
     @property
     def particulate_matter_2_5(self):
@@ -81,7 +98,7 @@ class DysonPureCoolBase(DysonFanDevice):
         self._set_configuration(fpwr="OFF")
 
     def _set_speed(self, speed: int) -> None:
-        self._set_configuration(fpwr="ON", fnsp=f"{speed:04d}")
+        self._set_configuration(fpwr="ON", fnsp=PADDED_VALUES[speed])
 
     def enable_auto_mode(self) -> None:
         """Turn on auto mode."""
@@ -117,22 +134,20 @@ class DysonPureCoolBase(DysonFanDevice):
 class DysonPureCool(DysonPureCoolBase):
     """Dyson Pure Cool device."""
 
-    @property
-    def oscillation(self) -> bool:
-        """Return oscillation status."""
-        # Seems some devices use OION/OIOF while others uses ON/OFF
-        # https://github.com/shenxn/ha-dyson/issues/22
-        return self._get_field_value(self._status, "oson") in ["OION", "ON"]
+    def __init__(self, serial: str, credential: str, device_type: str):
+        """Initialize the device."""
+        super().__init__(serial, credential, device_type)
+        self._oscillation_uses_oion = False
 
     @property
     def oscillation_angle_low(self) -> int:
         """Return oscillation low angle."""
-        return int(self._get_field_value(self._status, "osal"))
+        return int(self._status.get("osal"))
 
     @property
     def oscillation_angle_high(self) -> int:
         """Return oscillation high angle."""
-        return int(self._get_field_value(self._status, "osau"))
+        return int(self._status.get("osau"))
 
     def enable_oscillation(
         self,
@@ -145,33 +160,21 @@ class DysonPureCool(DysonPureCoolBase):
         if angle_high is None:
             angle_high = self.oscillation_angle_high
 
-        if not 5 <= angle_low <= 355:
-            raise ValueError("angle_low must be between 5 and 355")
-        if not 5 <= angle_high <= 355:
-            raise ValueError("angle_high must be between 5 and 355")
-        if angle_low != angle_high and angle_low + 30 > angle_high:
-            raise ValueError(
-                "angle_high must be either equal to angle_low or at least 30 larger than angle_low"
-            )
-
-        current_oscillation_raw = self._get_field_value(self._status, "oson")
-        if current_oscillation_raw in ["OION", "OIOF"]:
-            oson = "OION"
-        else:
-            oson = "ON"
+        _validate_oscillation_angles(angle_low, angle_high)
         self._set_configuration(
-            oson=oson,
+            oson="OION" if self._oscillation_uses_oion else "ON",
             fpwr="ON",
             ancp="CUST",
-            osal=f"{angle_low:04d}",
-            osau=f"{angle_high:04d}",
+            osal=PADDED_VALUES[angle_low],
+            osau=PADDED_VALUES[angle_high],
         )
 
     def disable_oscillation(self) -> None:
         """Turn off oscillation."""
-        current_oscillation_raw = self._get_field_value(self._status, "oson")
-        if current_oscillation_raw in ["OION", "OIOF"]:
-            oson = "OIOF"
-        else:
-            oson = "OFF"
-        self._set_configuration(oson=oson)
+        self._set_configuration(oson="OIOF" if self._oscillation_uses_oion else "OFF")
+
+    def _update_status(self, payload: dict) -> None:
+        super()._update_status(payload)
+        self._oscillation_uses_oion = (
+            self._status.get("oson") in _OSCILLATION_OION_VALUES
+        )
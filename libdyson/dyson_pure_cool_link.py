@@ -2,6 +2,9 @@
 
 from .const import AirQualityTarget
 from .dyson_device import DysonFanDevice
+from .utils import PADDED_VALUES
+
+_FAN_MODES_ON = frozenset({"FAN", "AUTO"})
 
 
 class DysonPureCoolLink(DysonFanDevice):
@@ -14,12 +17,12 @@ class DysonPureCoolLink(DysonFanDevice):
     @property
     def fan_mode(self) -> str:
         """Return the fan mode of the fan."""
-        return self._get_field_value(self._status, "fmod")
+        return self._status.get("fmod")
 
     @property
     def is_on(self) -> bool:
         """Return if the device is on."""
-        return self.fan_mode in ["FAN", "AUTO"]
+        return self.fan_mode in _FAN_MODES_ON
 
     @property
     def auto_mode(self) -> bool:
@@ -33,17 +36,17 @@ class DysonPureCoolLink(DysonFanDevice):
     @property
     def oscillation(self) -> bool:
         """Return oscillation status."""
-        return self._get_field_value(self._status, "oson") == "ON"
+        return self._status.get("oson") == "ON"
 
     @property
     def air_quality_target(self) -> AirQualityTarget:
         """Return air quality target."""
-        return AirQualityTarget(self._get_field_value(self._status, "qtar"))
+        return AirQualityTarget(self._status.get("qtar"))
 
     @property
     def filter_life(self) -> int:
         """Return filter life in hours."""
-        return int(self._get_field_value(self._status, "filf"))
+        return int(self._status.get("filf"))
 
     @property
     def particulates(self) -> int:
@@ -64,7 +67,7 @@ class DysonPureCoolLink(DysonFanDevice):
         self._set_configuration(fmod="OFF")
 
     def _set_speed(self, speed: int) -> None:
-        self._set_configuration(fmod="FAN", fnsp=f"{speed:04d}")
+        self._set_configuration(fmod="FAN", fnsp=PADDED_VALUES[speed])
 
     def enable_auto_mode(self) -> None:
         """Turn on auto mode."""
@@ -10,7 +10,7 @@ class DysonPureHotCoolLink(DysonPureCoolLink, DysonHeatingDevice):
     @property
     def tilt(self) -> bool:
         """Return tilt status."""
-        return self._get_field_value(self._status, "tilt") == "TILT"
+        return self._status.get("tilt") == "TILT"
 
     def enable_focus_mode(self) -> None:
         """Enable fan focus mode."""
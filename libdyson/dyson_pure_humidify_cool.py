@@ -1,18 +1,26 @@
 """Dyson Pure Humidify+Cool device."""
 
+from types import MappingProxyType
 from typing import Optional
 
 from .const import HumidifyOscillationMode, WaterHardness
 from .dyson_pure_cool import DysonPureCoolBase
+from .utils import PADDED_VALUES
 
-WATER_HARDNESS_ENUM_TO_STR = {
-    WaterHardness.SOFT: "2025",
-    WaterHardness.MEDIUM: "1350",
-    WaterHardness.HARD: "0675",
-}
-WATER_HARDNESS_STR_TO_ENUM = {
-    str_: enum for enum, str_ in WATER_HARDNESS_ENUM_TO_STR.items()
-}
+WATER_HARDNESS_ENUM_TO_STR = MappingProxyType(
+    {
+        WaterHardness.SOFT: "2025",
+        WaterHardness.MEDIUM: "1350",
+        WaterHardness.HARD: "0675",
+    }
+)
+WATER_HARDNESS_STR_TO_ENUM = MappingProxyType(
+    {str_: enum for enum, str_ in WATER_HARDNESS_ENUM_TO_STR.items()}
+)
+
+_OSCILLATION_MODES = MappingProxyType(
+    {mode.value: mode for mode in HumidifyOscillationMode}
+)
 
 
 class DysonPurifierHumidifyCool(DysonPureCoolBase):
@@ -21,47 +29,52 @@ class DysonPurifierHumidifyCool(DysonPureCoolBase):
     @property
     def oscillation(self) -> bool:
         """Return oscillation status."""
-        return self._get_field_value(self._status, "oson") == "ON"
+        return self._status.get("oson") == "ON"
 
     @property
     def oscillation_mode(self) -> HumidifyOscillationMode:
         """Return oscillation mode."""
-        return HumidifyOscillationMode(self._get_field_value(self._status, "ancp"))
+        ancp = self._status.get("ancp")
+        mode = _OSCILLATION_MODES.get(ancp)
+        if mode is None:
+            # Let the enum raise ValueError for unknown modes
+            return HumidifyOscillationMode(ancp)
+        return mode
 
     @property
     def humidification(self) -> bool:
         """Return if humidification is on."""
-        return self._get_field_value(self._status, "hume") == "HUMD"
+        return self._status.get("hume") == "HUMD"
 
     @property
     def humidification_auto_mode(self) -> bool:
         """Return if humidification auto mode is on."""
-        return self._get_field_value(self._status, "haut") == "ON"
+        return self._status.get("haut") == "ON"
 
     @property
     def target_humidity(self) -> int:
         """Return target humidity in percentage."""
-        return int(self._get_field_value(self._status, "humt"))
+        return int(self._status.get("humt"))
 
     @property
     def auto_target_humidity(self) -> int:
         """Return humidification auto mode target humidity."""
-        return int(self._get_field_value(self._status, "rect"))
+        return int(self._status.get("rect"))
 
     @property
     def water_hardness(self) -> WaterHardness:
         """Return the water hardness setting."""
-        return WATER_HARDNESS_STR_TO_ENUM[self._get_field_value(self._status, "wath")]
+        return WATER_HARDNESS_STR_TO_ENUM[self._status.get("wath")]
 
     @property
     def time_until_next_clean(self) -> int:
         """Return the time remaining in hours before the next deep cleaning."""
-        return int(self._get_field_value(self._status, "cltr"))
+        return int(self._status.get("cltr"))
 
     @property
     def clean_time_remaining(self) -> int:
         """Return the time remaining in minutes before the cleaning finishes."""
-        return int(self._get_field_value(self._status, "cdrr"))
+        return int(self._status.get("cdrr"))
 
     def enable_oscillation(
         self, oscillation_mode: Optional[HumidifyOscillationMode] = None
@@ -94,7 +107,9 @@ class DysonPurifierHumidifyCool(DysonPureCoolBase):
 
     def set_target_humidity(self, target_humidity: int) -> None:
         """Set target humidity."""
-        self._set_configuration(humt=f"{target_humidity:04d}", haut="OFF")
+        if not 30 <= target_humidity <= 70:
+            raise ValueError("Target humidity must be between 30 and 70")
+        self._set_configuration(humt=PADDED_VALUES[target_humidity], haut="OFF")
 
     def set_water_hardness(self, water_hardness: WaterHardness) -> None:
         """Set water hardness."""
@@ -4,6 +4,7 @@ from abc import abstractmethod
 from typing import Optional
 
 from .dyson_device import DysonFanDevice
+from .utils import PADDED_VALUES
 
 
 class DysonBigQuiet(DysonFanDevice):
@@ -12,32 +13,35 @@ class DysonBigQuiet(DysonFanDevice):
     @property
     def is_on(self) -> bool:
         """Return if the device is on."""
-        return self._get_field_value(self._status, "fpwr") == "ON"
+        return self._status.get("fpwr") == "ON"
 
     @property
     def auto_mode(self) -> bool:
         """Return auto mode status."""
-        return self._get_field_value(self._status, "auto") == "ON"
+        return self._status.get("auto") == "ON"
 
     @property
     def front_airflow(self) -> bool:
         """Return if airflow from front is on."""
-        return self._get_field_value(self._status, "fdir") == "ON"
+        return self._status.get("fdir") == "ON"
 
     @property
     def night_mode_speed(self) -> int:
         """Return speed in night mode."""
-        return int(self._get_field_value(self._status, "nmdv"))
+        return int(self._status.get("nmdv"))
 
     @property
     def tilt(self) -> int:
         """Return the tilt in degrees."""
-        return int(self._get_field_value(self._status, "otau") or self._get_field_value(self._status, "otal"))
+        tilt = self._status.get("otau")
+        if tilt is None:
+            tilt = self._status.get("otal")
+        return int(tilt)
 
     @property
     def carbon_filter_life(self) -> Optional[int]:
         """Return carbon filter life in percentage."""
-        filter_life = self._get_field_value(self._status, "cflr")
+        filter_life = self._status.get("cflr")
         if filter_life == "INV":
             return None
         return int(filter_life)
@@ -45,7 +49,7 @@ class DysonBigQuiet(DysonFanDevice):
     @property
     def hepa_filter_life(self) -> Optional[int]:
         """Return HEPA filter life in percentage."""
-        return int(self._get_field_value(self._status, "hflr"))
+        return int(self._status.get("hflr"))
 
     @property
     def particulate_matter_2_5(self):
@@ -90,7 +94,7 @@ class DysonBigQuiet(DysonFanDevice):
         self._set_configuration(otal=f"{tilt:04d}", otau=f"{tilt:04d}", anct=mode)
 
     def _set_speed(self, speed: int) -> None:
-        self._set_configuration(fpwr="ON", fnsp=f"{speed:04d}")
+        self._set_configuration(fpwr="ON", fnsp=PADDED_VALUES[speed])
 
     def enable_auto_mode(self) -> None:
         """Turn on auto mode."""
@@ -5,6 +5,15 @@ from typing import Optional, Tuple
 from .const import CleaningType, VacuumState
 from .dyson_device import DysonDevice
 
+_CHARGING_STATES = frozenset(
+    {
+        VacuumState.INACTIVE_CHARGING,
+        VacuumState.INACTIVE_CHARGED,
+        VacuumState.FULL_CLEAN_CHARGING,
+        VacuumState.MAPPING_CHARGING,
+    }
+)
+
 
 class DysonVacuumDevice(DysonDevice):
     """Dyson vacuum device."""
@@ -57,12 +66,7 @@ class DysonVacuumDevice(DysonDevice):
     @property
     def is_charging(self) -> bool:
         """Whether the device is charging."""
-        return self.state in [
-            VacuumState.INACTIVE_CHARGING,
-            VacuumState.INACTIVE_CHARGED,
-            VacuumState.FULL_CLEAN_CHARGING,
-            VacuumState.MAPPING_CHARGING,
-        ]
+        return self.state in _CHARGING_STATES
 
     def _update_status(self, payload: dict) -> None:
         self._status = payload
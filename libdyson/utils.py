@@ -15,6 +15,19 @@ _DEVICE_TYPE_MAP = {
     "455A": "455",
 }
 
+# Numeric command values are sent as zero padded four digit strings. Fan
+# speeds, oscillation angles, sleep timer durations and target humidity all
+# fall in this range. Callers must range check a value before indexing, as a
+# negative index would silently wrap around to the end of the table.
+PADDED_VALUES = tuple(f"{value:04d}" for value in range(541))
+
+_360_EYE_SSID_REGEX = re.compile(
+    r"^(360EYE-)?(?P<serial>[0-9A-Z]{3}-[A-Z]{2}-[0-9A-Z]{8,})$"
+)
+_DYSON_SSID_REGEX = re.compile(
+    r"^DYSON-([0-9A-Z]{3}-[A-Z]{2}-[0-9A-Z]{8,})-([0-9]{3}[A-Z]?)$"
+)
+
 
 def mqtt_time():
     """Return current time string for mqtt messages."""
@@ -32,14 +45,12 @@ def get_mqtt_info_from_wifi_info(
     wifi_ssid: str, wifi_password: str
 ) -> Tuple[str, str, str]:
     """Get MQTT information from WiFi information."""
-    result = re.match(r"^(360EYE-)?(?P<serial>[0-9A-Z]{3}-[A-Z]{2}-[0-9A-Z]{8,})$", wifi_ssid)
+    result = _360_EYE_SSID_REGEX.match(wifi_ssid)
     if result is not None:
         serial = result.group("serial")
         device_type = DEVICE_TYPE_360_EYE
     else:
-        result = re.match(
-            r"^DYSON-([0-9A-Z]{3}-[A-Z]{2}-[0-9A-Z]{8,})-([0-9]{3}[A-Z]?)$", wifi_ssid
-        )
+        result = _DYSON_SSID_REGEX.match(wifi_ssid)
         if result is not None:
             serial = result.group(1)
             device_type = result.group(2)
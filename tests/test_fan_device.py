@@ -116,6 +116,7 @@ def assert_command(
     assert len(mqtt_client.commands) == 1
     payload = mqtt_client.commands[0]
     assert payload["msg"] == "STATE-SET"
+    assert payload["mode-reason"] == "LAPP"
     assert payload["data"] == msg_data
 
 
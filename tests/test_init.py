@@ -1,8 +1,10 @@
 """Test Dyson Python library."""
 from typing import Type
+from unittest.mock import patch
 
 import pytest
 
+import libdyson
 from libdyson import (
     DEVICE_TYPE_360_EYE,
     DEVICE_TYPE_360_HEURIST,
@@ -10,12 +12,14 @@ from libdyson import (
     DEVICE_TYPE_PURE_COOL,
     DEVICE_TYPE_PURIFIER_COOL_E,
     DEVICE_TYPE_PURIFIER_COOL_K,
+    DEVICE_TYPE_PURIFIER_COOL_M,
     DEVICE_TYPE_PURE_COOL_DESK,
     DEVICE_TYPE_PURE_COOL_LINK,
     DEVICE_TYPE_PURE_COOL_LINK_DESK,
     DEVICE_TYPE_PURE_HOT_COOL,
     DEVICE_TYPE_PURIFIER_HOT_COOL_E,
     DEVICE_TYPE_PURIFIER_HOT_COOL_K,
+    DEVICE_TYPE_PURIFIER_HOT_COOL_M,
     DEVICE_TYPE_PURE_HOT_COOL_LINK,
     DEVICE_TYPE_PURE_HUMIDIFY_COOL,
     DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E,
@@ -34,7 +38,7 @@ from libdyson import (
     get_device,
 )
 
-from . import CREDENTIAL, SERIAL
+from . import CREDENTIAL, HOST, SERIAL
 
 
 @pytest.mark.parametrize(
@@ -48,11 +52,13 @@ from . import CREDENTIAL, SERIAL
         (DEVICE_TYPE_PURE_COOL, DysonPureCool),
         (DEVICE_TYPE_PURIFIER_COOL_E, DysonPureCool),
         (DEVICE_TYPE_PURIFIER_COOL_K, DysonPureCool),
+        (DEVICE_TYPE_PURIFIER_COOL_M, DysonPureCool),
         (DEVICE_TYPE_PURE_COOL_DESK, DysonPureCool),
         (DEVICE_TYPE_PURE_HOT_COOL_LINK, DysonPureHotCoolLink),
         (DEVICE_TYPE_PURE_HOT_COOL, DysonPureHotCool),
         (DEVICE_TYPE_PURIFIER_HOT_COOL_E, DysonPureHotCool),
         (DEVICE_TYPE_PURIFIER_HOT_COOL_K, DysonPureHotCool),
+        (DEVICE_TYPE_PURIFIER_HOT_COOL_M, DysonPureHotCool),
         (DEVICE_TYPE_PURE_HUMIDIFY_COOL, DysonPurifierHumidifyCool),
         (DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_E, DysonPurifierHumidifyCool),
         (DEVICE_TYPE_PURIFIER_HUMIDIFY_COOL_K, DysonPurifierHumidifyCool),
@@ -70,3 +76,50 @@ def test_get_device_unknown():
     """Test get_device with unknown type."""
     device = get_device(SERIAL, CREDENTIAL, "unknown")
     assert device is None
+
+
+def test_device_instance_attributes():
+    """Test device instances still accept patching and ad-hoc attributes."""
+    device = get_device(SERIAL, CREDENTIAL, DEVICE_TYPE_PURE_COOL)
+    device.name = "Living room"
+    assert device.name == "Living room"
+    with patch.object(device, "connect") as connect:
+        device.connect(HOST)
+    connect.assert_called_once_with(HOST)
+
+
+def test_star_import():
+    """Test star-import exports the lazily imported device classes."""
+    namespace = {}
+    exec("from libdyson import *", namespace)
+    for name in libdyson.__all__:
+        assert namespace[name] is getattr(libdyson, name)
+    assert namespace["DysonPureCool"] is DysonPureCool
+    assert set(libdyson._DEVICE_CLASS_MODULES) <= set(libdyson.__all__)
+
+
+def test_device_classes_have_modules():
+    """Test every device type maps to a lazily importable class."""
+    for class_name in libdyson._DEVICE_CLASSES.values():
+        assert class_name in libdyson._DEVICE_CLASS_MODULES
+
+
+def test_unknown_attribute():
+    """Test accessing an attribute that is not a device class."""
+    with pytest.raises(AttributeError, match="DysonUnknownDevice"):
+        getattr(libdyson, "DysonUnknownDevice")
+
+
+def test_dir_lists_device_classes():
+    """Test lazily imported device classes are listed by dir()."""
+    assert "DysonPureCool" in dir(libdyson)
+    assert "get_device" in dir(libdyson)
+
+
+def test_get_device_imports_once():
+    """Test get_device reuses the resolved class."""
+    get_device(SERIAL, CREDENTIAL, DEVICE_TYPE_PURE_COOL)
+    with patch("libdyson.importlib.import_module") as import_module:
+        device = get_device(SERIAL, CREDENTIAL, DEVICE_TYPE_PURE_COOL)
+    import_module.assert_not_called()
+    assert isinstance(device, DysonPureCool)
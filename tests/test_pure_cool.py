@@ -253,20 +253,20 @@ def test_oscillation_ON_OFF(mqtt_client: MockedMQTT):
 
 
 @pytest.mark.parametrize(
-    "angle_low,angle_high",
+    "angle_low,angle_high,message",
     [
-        (3, 300),
-        (5, 400),
-        (300, 5),
-        (5, 34),
+        (3, 300, "angle_low"),
+        (5, 400, "angle_high must be between"),
+        (300, 5, "at least 30 larger"),
+        (5, 34, "at least 30 larger"),
     ],
 )
 def test_oscillation_invalid_data(
-    mqtt_client: MockedMQTT, angle_low: int, angle_high: int
+    mqtt_client: MockedMQTT, angle_low: int, angle_high: int, message: str
 ):
     """Test commands with invalid data."""
     device = DysonPureCool(SERIAL, CREDENTIAL, DEVICE_TYPE)
     device.connect(HOST)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match=message):
         device.enable_oscillation(angle_low, angle_high)
     assert len(mqtt_client.commands) == 0
@@ -115,3 +115,15 @@ def test_command(
         command_args,
         msg_data,
     )
+
+
+@pytest.mark.parametrize("target_humidity", [29, 71])
+def test_set_target_humidity_invalid_data(
+    mqtt_client: MockedMQTT, target_humidity: int
+):
+    """Test setting target humidity out of range."""
+    device = DysonPurifierHumidifyCool(SERIAL, CREDENTIAL, DEVICE_TYPE)
+    device.connect(HOST)
+    with pytest.raises(ValueError):
+        device.set_target_humidity(target_humidity)
+    assert len(mqtt_client.commands) == 0
@@ -137,6 +137,22 @@ def test_properties(mqtt_client: MockedMQTT):
     assert device.carbon_dioxide == 400
 
 
+def test_tilt_without_otau(mqtt_client: MockedMQTT):
+    """Test tilt falls back to otal when otau is not reported."""
+    device = DysonBigQuiet(SERIAL, CREDENTIAL, DEVICE_TYPE)
+    device.connect(HOST)
+
+    mqtt_client.state_change(
+        {
+            "product-state": {
+                "fpwr": ["OFF", "ON"],
+                "otal": ["0025", "0050"],
+            },
+        }
+    )
+    assert device.tilt == 50
+
+
 @pytest.mark.parametrize(
     "command,command_args,msg_data",
     [